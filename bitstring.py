@@ -156,6 +156,20 @@ class CreationError(Error, ValueError):
         Error.__init__(self, *params)
 
 
+# Byte masks indexed by a bit offset 0-8: the bits from the offset onwards, and the bits before the offset.
+LOW_BITS_MASK: Tuple[int, ...] = tuple(0xff >> i for i in range(9))
+HIGH_BITS_MASK: Tuple[int, ...] = tuple(0xff ^ (0xff >> i) for i in range(9))
+
+# Maximum number of bytes to read at once when counting bits, so that large files aren't read into memory.
+COUNT_CHUNK_BYTES: int = 1 << 20
+
+# Maximum number of bytes to read at once when comparing data that could be from a large file.
+COMPARE_CHUNK_BYTES: int = 1 << 16
+
+# Translation table for bytes.translate that inverts every bit of each byte.
+INVERT_TABLE: bytes = bytes(0xff ^ i for i in range(0x100))
+
+
 class ByteStore:
     """Stores raw bytes together with a bit offset and length.
 
@@ -175,7 +189,7 @@ class ByteStore:
             cls.unsetbit = cls._unsetbit_msb0
             cls.invertbit = cls._invertbit_msb0
 
-    __slots__ = ('offset', 'rawarray', 'bitlength')
+    __slots__ = ('offset', 'rawarray', 'bitlength', 'byteoffset', 'bytelength')
 
     def __init__(self, data: Union[bytearray, MmapByteArray],
                  bitlength: Optional[int] = None, offset: int = 0) -> None:
@@ -184,6 +198,15 @@ class ByteStore:
             bitlength = 8 * len(data) - offset
         self.offset = offset
         self.bitlength = bitlength
+        self._setbytepositions()
+
+    def _setbytepositions(self) -> None:
+        """Recalculate byteoffset and bytelength. Call whenever offset or bitlength changes."""
+        self.byteoffset = self.offset // 8
+        if not self.bitlength:
+            self.bytelength = 0
+        else:
+            self.bytelength = (self.offset + self.bitlength - 1) // 8 - self.byteoffset + 1
 
     def __iter__(self) -> Iterator[bool]:
         start_byte, start_bit = divmod(self.offset, 8)
@@ -216,14 +239,13 @@ class ByteStore:
 
     def _getbit_lsb0(self, pos: int) -> bool:
         assert 0 <= pos < self.bitlength
-        pos = self.bitlength - pos - 1
-        byte, bit = divmod(self.offset + pos, 8)
-        return bool(self.rawarray[byte] & (128 >> bit))
+        pos = self.offset + self.bitlength - pos - 1
+        return bool(self.rawarray[pos >> 3] & (128 >> (pos & 7)))
 
     def _getbit_msb0(self, pos: int) -> bool:
         assert 0 <= pos < self.bitlength
-        byte, bit = divmod(self.offset + pos, 8)
-        return bool(self.rawarray[byte] & (128 >> bit))
+        pos += self.offset
+        return bool(self.rawarray[pos >> 3] & (128 >> (pos & 7)))
 
     def getbyte(self, pos: int) -> int:
         """Direct access to byte data."""
@@ -233,87 +255,136 @@ class ByteStore:
         """Direct access to byte data."""
         return self.rawarray[start:end]
 
-    @property
-    def bytelength(self) -> int:
-        if not self.bitlength:
-            return 0
-        sb = self.offset // 8
-        eb = (self.offset + self.bitlength - 1) // 8
-        return eb - sb + 1
-
     def __copy__(self) -> ByteStore:
         return ByteStore(self.rawarray[:], self.bitlength, self.offset)
 
+    def getuint(self, start: int = 0, length: Optional[int] = None) -> int:
+        """Return length bits from start (default all of them) as a single unsigned integer."""
+        if length is None:
+            length = self.bitlength - start
+        startbit = self.offset + start
+        data = self.getbyteslice(startbit // 8, (startbit + length + 7) // 8)
+        bits = int.from_bytes(data, 'big') >> (len(data) * 8 - startbit % 8 - length)
+        return bits & ((1 << length) - 1)
+
     def appendstore(self, store: ByteStore) -> None:
         """Join another store on to the end of this one."""
         if not store.bitlength:
             return
-        # Set new array offset to the number of bits in the final byte of current array.
-        store = offsetcopy(store, (self.offset + self.bitlength) % 8)
-        if store.offset != 0:
-            # first do the byte with the join.
-            joinval = (self.rawarray.pop() & (255 ^ (255 >> store.offset)) |
-                       (store.getbyte(0) & (255 >> store.offset)))
-            self.rawarray.append(joinval)
-            self.rawarray.extend(store.rawarray[1:])
+        end = self.offset + self.bitlength
+        join_bits = end % 8
+        # Drop any bytes past our final bit so that the new bits go straight after it.
+        del self.rawarray[(end + 7) // 8:]
+        if store.offset % 8 == join_bits:
+            # The new bits already line up with our final byte so don't need shifting.
+            start = store.byteoffset
+            stop = start + store.bytelength
+            if join_bits:
+                self.rawarray[-1] = ((self.rawarray[-1] & HIGH_BITS_MASK[join_bits]) |
+                                     (store.getbyte(start) & LOW_BITS_MASK[join_bits]))
+                start += 1
+            if start < stop:
+                if isinstance(store.rawarray, bytearray) and store.rawarray is not self.rawarray:
+                    # Append straight from the other array without an intermediate copy.
+                    self.rawarray += memoryview(store.rawarray)[start:stop]
+                else:
+                    # A memoryview of our own array would stop it being resized.
+                    self.rawarray += store.getbyteslice(start, stop)
         else:
-            self.rawarray.extend(store.rawarray)
+            # Shift the new bits straight into place after any bits used in our final byte.
+            bits = store.getuint()
+            if join_bits:
+                bits |= (self.rawarray[-1] >> (8 - join_bits)) << store.bitlength
+            total_bits = join_bits + store.bitlength
+            new_bytelength = (total_bits + 7) // 8
+            bits <<= new_bytelength * 8 - total_bits
+            # The join byte (if any) is included in the new data.
+            if join_bits:
+                self.rawarray[-1:] = bits.to_bytes(new_bytelength, 'big')
+            else:
+                self.rawarray += bits.to_bytes(new_bytelength, 'big')
         self.bitlength += store.bitlength
+        self._setbytepositions()
 
     def prependstore(self, store: ByteStore) -> None:
         """Join another store on to the start of this one."""
         if not store.bitlength:
             return
-            # Set the offset of copy of store so that it's final byte
-        # ends in a position that matches the offset of self,
-        # then join self on to the end of it.
-        store = offsetcopy(store, (self.offset - store.bitlength) % 8)
-        assert (store.offset + store.bitlength) % 8 == self.offset % 8
         bit_offset = self.offset % 8
+        if (store.offset + store.bitlength) % 8 == bit_offset:
+            # The new bits already line up with our first byte so don't need shifting.
+            new_offset = store.offset % 8
+            rawarray = store.getbyteslice(store.byteoffset, store.byteoffset + store.bytelength)
+            if bit_offset:
+                rawarray[-1] = ((rawarray[-1] & HIGH_BITS_MASK[bit_offset]) |
+                                (self.rawarray[self.byteoffset] & LOW_BITS_MASK[bit_offset]))
+        else:
+            # Shift the new bits straight into place so that they end just before our first bit,
+            # joined to the rest of our first byte if it's only partly used.
+            bits = store.getuint()
+            if bit_offset:
+                bits = (bits << (8 - bit_offset)) | (self.rawarray[self.byteoffset] & LOW_BITS_MASK[bit_offset])
+            new_offset = (bit_offset - store.bitlength) % 8
+            # The new bits plus the rest of the first byte now fill a whole number of bytes.
+            new_bytelength = (new_offset + store.bitlength + 7) // 8
+            rawarray = bytearray(bits.to_bytes(new_bytelength, 'big'))
+        # The join byte (if any) is already included in the new data.
         if bit_offset:
-            # first do the byte with the join.
-            joinval = (store.getbyte(-1) & (255 ^ (255 >> bit_offset)) | 
-                       (self.rawarray[self.byteoffset] & (255 >> bit_offset)))
-            store.rawarray[-1] = joinval
-            store.rawarray.extend(self.rawarray[self.byteoffset + 1: self.byteoffset + self.bytelength])
+            rawarray += memoryview(self.rawarray)[self.byteoffset + 1: self.byteoffset + self.bytelength]
         else:
-            store.rawarray.extend(self.rawarray[self.byteoffset: self.byteoffset + self.bytelength])
-        self.rawarray = store.rawarray
-        self.offset = store.offset
+            rawarray += memoryview(self.rawarray)[self.byteoffset: self.byteoffset + self.bytelength]
+        self.rawarray = rawarray
+        self.offset = new_offset
         self.bitlength += store.bitlength
+        self._setbytepositions()
 
     def _setbit_lsb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        pos = self.bitlength - pos - 1
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] |= (128 >> bit)
+        pos = self.offset + self.bitlength - pos - 1
+        self.rawarray[pos >> 3] |= (128 >> (pos & 7))
 
     def _setbit_msb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] |= (128 >> bit)
+        pos += self.offset
+        self.rawarray[pos >> 3] |= (128 >> (pos & 7))
 
     def _unsetbit_lsb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        pos = self.bitlength - pos - 1
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] &= ~(128 >> bit)
+        pos = self.offset + self.bitlength - pos - 1
+        self.rawarray[pos >> 3] &= ~(128 >> (pos & 7))
 
     def _unsetbit_msb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] &= ~(128 >> bit)
+        pos += self.offset
+        self.rawarray[pos >> 3] &= ~(128 >> (pos & 7))
 
     def _invertbit_lsb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        pos = self.bitlength - pos - 1
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] ^= (128 >> bit)
+        pos = self.offset + self.bitlength - pos - 1
+        self.rawarray[pos >> 3] ^= (128 >> (pos & 7))
 
     def _invertbit_msb0(self, pos: int) -> None:
         assert 0 <= pos < self.bitlength
-        byte, bit = divmod(self.offset + pos, 8)
-        self.rawarray[byte] ^= (128 >> bit)
+        pos += self.offset
+        self.rawarray[pos >> 3] ^= (128 >> (pos & 7))
+
+    def invertbits(self) -> None:
+        """Invert every bit in the store."""
+        if not self.bitlength:
+            return
+        start = self.byteoffset
+        end = self.byteoffset + self.bytelength
+        first_byte = self.rawarray[start]
+        last_byte = self.rawarray[end - 1]
+        self.rawarray[start:end] = self.rawarray[start:end].translate(INVERT_TABLE)
+        # Put back any bits in the first and last bytes that aren't part of the store.
+        bit_offset = self.offset % 8
+        self.rawarray[start] = ((first_byte & HIGH_BITS_MASK[bit_offset]) |
+                                (self.rawarray[start] & LOW_BITS_MASK[bit_offset]))
+        end_bits = (self.offset + self.bitlength) % 8
+        if end_bits:
+            self.rawarray[end - 1] = ((last_byte & LOW_BITS_MASK[end_bits]) |
+                                      (self.rawarray[end - 1] & HIGH_BITS_MASK[end_bits]))
 
     def setbyte(self, pos: int, value: int) -> None:
         self.rawarray[pos] = value
@@ -321,10 +392,6 @@ class ByteStore:
     def setbyteslice(self, start: int, end: int, value: bytearray) -> None:
         self.rawarray[start:end] = value
 
-    @property
-    def byteoffset(self) -> int:
-        return self.offset // 8
-
     @property
     def rawbytes(self) -> Union[bytearray, MmapByteArray]:
         return self.rawarray
@@ -336,38 +403,34 @@ def offsetcopy(s: ByteStore, newoffset: int) -> ByteStore:
     Not part of public interface.
     """
     assert 0 <= newoffset < 8
-    if not s.bitlength:
+    s_bitlength = s.bitlength
+    if not s_bitlength:
         return copy.copy(s)
-    else:
-        if newoffset == s.offset % 8:
-            return type(s)(s.getbyteslice(s.byteoffset, s.byteoffset + s.bytelength), s.bitlength, newoffset)
-        newdata = []
-        d = s.rawarray
-        assert newoffset != s.offset % 8
-        if newoffset < s.offset % 8:
-            # We need to shift everything left
-            shiftleft = s.offset % 8 - newoffset
-            # First deal with everything except for the final byte
-            for x in range(s.byteoffset, s.byteoffset + s.bytelength - 1):
-                newdata.append(((d[x] << shiftleft) & 0xff) + (d[x + 1] >> (8 - shiftleft)))
-            bits_in_last_byte = (s.offset + s.bitlength) % 8
-            if not bits_in_last_byte:
-                bits_in_last_byte = 8
-            if bits_in_last_byte > shiftleft:
-                newdata.append((d[s.byteoffset + s.bytelength - 1] << shiftleft) & 0xff)
-        else:  # newoffset > s._offset % 8
-            shiftright = newoffset - s.offset % 8
-            newdata.append(s.getbyte(0) >> shiftright)
-            for x in range(s.byteoffset + 1, s.byteoffset + s.bytelength):
-                newdata.append(((d[x - 1] << (8 - shiftright)) & 0xff) + (d[x] >> shiftright))
-            bits_in_last_byte = (s.offset + s.bitlength) % 8
-            if not bits_in_last_byte:
-                bits_in_last_byte = 8
-            if bits_in_last_byte + shiftright > 8:
-                newdata.append((d[s.byteoffset + s.bytelength - 1] << (8 - shiftright)) & 0xff)
-        new_s = type(s)(bytearray(newdata), s.bitlength, newoffset)
-        assert new_s.offset == newoffset
-        return new_s
+    if newoffset == s.offset % 8:
+        s_byteoffset = s.byteoffset
+        return type(s)(s.getbyteslice(s_byteoffset, s_byteoffset + s.bytelength), s_bitlength, newoffset)
+    # Shift all of the bits in one go by treating them as a single integer.
+    bits = s.getuint()
+    new_bytelength = (newoffset + s_bitlength + 7) // 8
+    bits <<= new_bytelength * 8 - newoffset - s_bitlength
+    return type(s)(bytearray(bits.to_bytes(new_bytelength, 'big')), s_bitlength, newoffset)
+
+
+def equalbytes(da: Union[bytearray, MmapByteArray], a_start: int,
+               db: Union[bytearray, MmapByteArray], b_start: int, length: int) -> bool:
+    """Return True if length bytes of da from a_start equal those of db from b_start.
+
+    Not part of public interface.
+    """
+    if isinstance(da, bytearray) and isinstance(db, bytearray):
+        # startswith compares against a buffer directly, so nothing gets copied.
+        return da.startswith(memoryview(db)[b_start:b_start + length], a_start)
+    # File-backed data is compared in chunks so that it isn't all read into memory.
+    for i in range(0, length, COMPARE_CHUNK_BYTES):
+        n = min(COMPARE_CHUNK_BYTES, length - i)
+        if da[a_start + i:a_start + i + n] != db[b_start + i:b_start + i + n]:
+            return False
+    return True
 
 
 def equal(a: ByteStore, b: ByteStore) -> bool:
@@ -386,92 +449,58 @@ def equal(a: ByteStore, b: ByteStore) -> bool:
         assert b_bitlength == 0
         return True
     # Make 'a' the one with the smaller offset
-    if (a.offset % 8) > (b.offset % 8):
+    a_offset = a.offset
+    b_offset = b.offset
+    if (a_offset % 8) > (b_offset % 8):
         a, b = b, a
+        a_offset, b_offset = b_offset, a_offset
+    da = a.rawarray
+    db = b.rawarray
+    # If they are pointing to the same data, they must be equal
+    if da is db and a_offset == b_offset:
+        return True
     # and create some aliases
-    a_bitoff = a.offset % 8
-    b_bitoff = b.offset % 8
+    a_bitoff = a_offset % 8
+    b_bitoff = b_offset % 8
     a_byteoffset = a.byteoffset
     b_byteoffset = b.byteoffset
     a_bytelength = a.bytelength
     b_bytelength = b.bytelength
-    da = a.rawarray
-    db = b.rawarray
 
-    # If they are pointing to the same data, they must be equal
-    if da is db and a.offset == b.offset:
-        return True
+    # Whole bytes on byte boundaries (the most common case) can be compared directly
+    if not (a_offset | b_offset | a_bitlength) % 8:
+        return equalbytes(da, a_byteoffset, db, b_byteoffset, a_bytelength)
+    # Short stores are quickest to compare as two integers
+    if a_bitlength <= 128:
+        return a.getuint() == b.getuint()
 
     if a_bitoff == b_bitoff:
         bits_spare_in_last_byte = 8 - (a_bitoff + a_bitlength) % 8
         if bits_spare_in_last_byte == 8:
             bits_spare_in_last_byte = 0
-        # Special case for a, b contained in a single byte
-        if a_bytelength == 1:
-            a_val = ((da[a_byteoffset] << a_bitoff) & 0xff) >> (8 - a_bitlength)
-            b_val = ((db[b_byteoffset] << b_bitoff) & 0xff) >> (8 - b_bitlength)
-            return a_val == b_val
-        # Otherwise check first byte
-        if da[a_byteoffset] & (0xff >> a_bitoff) != db[b_byteoffset] & (0xff >> b_bitoff):
+        # Check first byte
+        if da[a_byteoffset] & LOW_BITS_MASK[a_bitoff] != db[b_byteoffset] & LOW_BITS_MASK[b_bitoff]:
             return False
         # then everything up to the last
-        b_a_offset = b_byteoffset - a_byteoffset
-        for x in range(1 + a_byteoffset, a_byteoffset + a_bytelength - 1):
-            if da[x] != db[b_a_offset + x]:
-                return False
+        if not equalbytes(da, a_byteoffset + 1, db, b_byteoffset + 1, a_bytelength - 2):
+            return False
         # and finally the last byte
         return (da[a_byteoffset + a_bytelength - 1] >> bits_spare_in_last_byte ==
                 db[b_byteoffset + b_bytelength - 1] >> bits_spare_in_last_byte)
 
     assert a_bitoff != b_bitoff
-    # This is how much we need to shift a to the right to compare with b:
-    shift = b_bitoff - a_bitoff
-    # Special case for b only one byte long
-    if b_bytelength == 1:
-        assert a_bytelength == 1
-        a_val = ((da[a_byteoffset] << a_bitoff) & 0xff) >> (8 - a_bitlength)
-        b_val = ((db[b_byteoffset] << b_bitoff) & 0xff) >> (8 - b_bitlength)
-        return a_val == b_val
-    # Special case for a only one byte long
-    if a_bytelength == 1:
-        assert b_bytelength == 2
-        a_val = ((da[a_byteoffset] << a_bitoff) & 0xff) >> (8 - a_bitlength)
-        b_val = ((db[b_byteoffset] << 8) + db[b_byteoffset + 1]) << b_bitoff
-        b_val &= 0xffff
-        b_val >>= 16 - b_bitlength
-        return a_val == b_val
-
     # Compare first byte of b with bits from first byte of a
-    if (da[a_byteoffset] & (0xff >> a_bitoff)) >> shift != db[b_byteoffset] & (0xff >> b_bitoff):
+    shift = b_bitoff - a_bitoff
+    if (da[a_byteoffset] & LOW_BITS_MASK[a_bitoff]) >> shift != db[b_byteoffset] & LOW_BITS_MASK[b_bitoff]:
         return False
-    # Now compare every full byte of b with bits from 2 bytes of a
-    for x in range(1, b_bytelength - 1):
-        # Construct byte from 2 bytes in a to compare to byte in b
-        b_val = db[b_byteoffset + x]
-        a_val = ((da[a_byteoffset + x - 1] << 8) + da[a_byteoffset + x]) >> shift
-        a_val &= 0xff
-        if a_val != b_val:
+    # then compare the rest as integers, a window at a time so that large stores
+    # aren't read into memory all at once and we can stop at the first difference.
+    window = COMPARE_CHUNK_BYTES * 8
+    for start in range(0, a_bitlength, window):
+        length = min(window, a_bitlength - start)
+        if a.getuint(start, length) != b.getuint(start, length):
             return False
-
-    # Now check bits in final byte of b
-    final_b_bits = (b.offset + b_bitlength) % 8
-    if not final_b_bits:
-        final_b_bits = 8
-    b_val = db[b_byteoffset + b_bytelength - 1] >> (8 - final_b_bits)
-    final_a_bits = (a.offset + a_bitlength) % 8
-    if not final_a_bits:
-        final_a_bits = 8
-    if b.bytelength > a_bytelength:
-        assert b_bytelength == a_bytelength + 1
-        a_val = da[a_byteoffset + a_bytelength - 1] >> (8 - final_a_bits)
-        a_val &= 0xff >> (8 - final_b_bits)
-        return a_val == b_val
-    assert a_bytelength == b_bytelength
-    a_val = da[a_byteoffset + a_bytelength - 2] << 8
-    a_val += da[a_byteoffset + a_bytelength - 1]
-    a_val >>= (8 - final_a_bits)
-    a_val &= 0xff >> (8 - final_b_bits)
-    return a_val == b_val
+    return True
 
 
 class MmapByteArray:
@@ -485,8 +514,7 @@ class MmapByteArray:
     def __init__(self, source: Union[BinaryIO, io.BufferedReader], bytelength: Optional[int] = None,
                  byteoffset: Optional[int] = None) -> None:
         self.source = source
-        source.seek(0, os.SEEK_END)
-        self.filelength = source.tell()
+        self.filelength = os.fstat(source.fileno()).st_size
         if byteoffset is None:
             byteoffset = 0
         if bytelength is None:
@@ -501,20 +529,20 @@ class MmapByteArray:
     def __getitem__(self, key: int) -> int: ...
 
     def __getitem__(self, key: Union[slice, int]) -> Union[bytearray, int]:
-        if isinstance(key, slice):
-            start = key.start
-            stop = key.stop
-            if start is None:
-                start = 0
-            if stop is None:
-                stop = self.bytelength
-            assert key.step is None
-            assert 0 <= start < self.bytelength
-            assert 0 <= stop <= self.bytelength
-            s = slice(start + self.byteoffset, stop + self.byteoffset)
-            return bytearray(self.filemap.__getitem__(s))
-        else:
+        # Single bytes are the common case (from getbit and getbyte). The mmap is already
+        # backed by the OS page cache so there's no need for any extra buffering here.
+        if not isinstance(key, slice):
             return self.filemap[key + self.byteoffset]
+        start = key.start
+        stop = key.stop
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = self.bytelength
+        assert key.step is None
+        assert 0 <= start < self.bytelength
+        assert 0 <= stop <= self.bytelength
+        return bytearray(self.filemap[start + self.byteoffset: stop + self.byteoffset])
 
     def __len__(self) -> int:
         return self.bytelength
@@ -854,7 +882,7 @@ class Bits:
 
     # Creates dictionaries to quickly reverse single bytes
     _int8ReversalDict: Dict[int, int] = {i: int("{0:08b}".format(i)[::-1], 2) for i in range(0x100)}
-    _byteReversalDict: Dict[int, bytes] = {i: bytes([int("{0:08b}".format(i)[::-1], 2)]) for i in range(0x100)}
+    _byteReversalTable: bytes = bytes(int("{0:08b}".format(i)[::-1], 2) for i in range(0x100))
 
     def __init__(self, auto: Optional[BitsType] = None, length: Optional[int] = None,
                  offset: Optional[int] = None, **kwargs) -> None:
@@ -1449,7 +1477,13 @@ class Bits:
         if isinstance(s, Bits):
             if length is None:
                 length = s._getlength() - offset
-            self._setbytes_unsafe(s._datastore.rawbytes, length, s._offset + offset)
+            if not length:
+                self._setbytes_unsafe(bytearray(0), 0, 0)
+                return
+            # Only copy the bytes that are needed, not all of the data (which could be a whole file).
+            byteoffset, offset = divmod(s._offset + offset, 8)
+            bytelength = (offset + length + 7) // 8
+            self._setbytes_unsafe(s._datastore.getbyteslice(byteoffset, byteoffset + bytelength), length, offset)
             return
 
         if isinstance(s, io.BytesIO):
@@ -1465,7 +1499,7 @@ class Bits:
 
         if isinstance(s, io.BufferedReader):
             if length is None:
-                length = os.path.getsize(s.name) * 8 - offset
+                length = os.fstat(s.fileno()).st_size * 8 - offset
             byteoffset, offset = divmod(offset, 8)
             bytelength = (length + byteoffset * 8 + offset + 7) // 8 - byteoffset
             m = MmapByteArray(s, bytelength, byteoffset)
@@ -1509,7 +1543,7 @@ class Bits:
             if offset is None:
                 offset = 0
             if length is None:
-                length = os.path.getsize(source.name) * 8 - offset
+                length = os.fstat(source.fileno()).st_size * 8 - offset
             byteoffset, offset = divmod(offset, 8)
             bytelength = (length + byteoffset * 8 + offset + 7) // 8 - byteoffset
             m = MmapByteArray(source, bytelength, byteoffset)
@@ -2170,8 +2204,9 @@ class Bits:
     def _copy(self) -> Bits:
         """Create and return a new copy of the Bits (always in memory)."""
         s_copy = self.__class__()
-        s_copy._setbytes_unsafe(self._datastore.getbyteslice(0, self._datastore.bytelength),
-                                self.len, self._offset)
+        s_copy._setbytes_unsafe(self._datastore.getbyteslice(self._datastore.byteoffset,
+                                                             self._datastore.byteoffset + self._datastore.bytelength),
+                                self.len, self._offset % 8)
         return s_copy
 
     def _slice_lsb0(self, start: int, end: int) -> Bits:
@@ -2216,14 +2251,16 @@ class Bits:
     def _reverse(self) -> None:
         """Reverse all bits in-place."""
         # Reverse the contents of each byte
-        n = [Bits._byteReversalDict[b] for b in self._datastore.rawbytes]
+        n = self._datastore.getbyteslice(self._datastore.byteoffset,
+                                         self._datastore.byteoffset + self._datastore.bytelength)
+        n = n.translate(Bits._byteReversalTable)
         # Then reverse the order of the bytes
         n.reverse()
         # The new offset is the number of bits that were unused at the end.
         newoffset = 8 - (self._offset + self.len) % 8
         if newoffset == 8:
             newoffset = 0
-        self._setbytes_unsafe(bytearray().join(n), self.length, newoffset)
+        self._setbytes_unsafe(n, self.length, newoffset)
 
     def _truncateleft(self, bits: int) -> Bits:
         """Truncate bits from the start of the bitstring. Return the truncated bits."""
@@ -2373,8 +2410,7 @@ class Bits:
 
     def _invert_all(self) -> None:
         """Invert every bit."""
-        for p in range(self._datastore.byteoffset, self._datastore.byteoffset + self._datastore.bytelength):
-            self._datastore.rawarray[p] = 256 + ~self._datastore.rawarray[p]
+        self._datastore.invertbits()
 
     def _ilshift(self, n: int) -> Bits:
         """Shift bits by n to the left in place. Return self."""
@@ -2406,18 +2442,13 @@ class Bits:
 
     def _inplace_logical_helper(self, bs: Bits, f: Callable[[int, int], int]) -> Bits:
         """Helper function containing most of the __ior__, __iand__, __ixor__ code."""
-        # Give the two bitstrings the same offset (modulo 8)
-        self_byteoffset, self_bitoffset = divmod(self._getoffset(), 8)
-        bs_byteoffset, bs_bitoffset = divmod(bs._getoffset(), 8)
-        if bs_bitoffset != self_bitoffset:
-            if not self_bitoffset:
-                bs._datastore = offsetcopy(bs._datastore, 0)
-            else:
-                self._datastore = offsetcopy(self._datastore, bs_bitoffset)
-        a = self._datastore.rawbytes
-        b = bs._datastore.rawbytes
-        for i in range(len(a)):
-            a[i] = f(a[i + self_byteoffset], b[i + bs_byteoffset])
+        # Give a copy of bs the same offset (modulo 8) as self
+        a = self._datastore
+        b = offsetcopy(bs._datastore, a.offset % 8)
+        # then combine all of the bytes in one go by treating them as integers.
+        a_val = int.from_bytes(a.getbyteslice(a.byteoffset, a.byteoffset + a.bytelength), 'big')
+        b_val = int.from_bytes(b.getbyteslice(b.byteoffset, b.byteoffset + b.bytelength), 'big')
+        a.setbyteslice(a.byteoffset, a.byteoffset + a.bytelength, f(a_val, b_val).to_bytes(a.bytelength, 'big'))
         return self
 
     def _ior(self, bs: Bits) -> Bits:
@@ -3014,14 +3045,24 @@ class Bits:
         if not self.len:
             return 0
         # count the number of 1s (from which it's easy to work out the 0s).
-        # Don't count the final byte yet.
-        count = sum(Bits._bitCount[self._datastore.getbyte(i)] for i in range(self._datastore.bytelength - 1))
-        # adjust for bits at start that aren't part of the bitstring
-        if self._offset:
-            count -= Bits._bitCount[self._datastore.getbyte(0) >> (8 - self._offset)]
-        # and count the last 1 - 8 bits at the end.
-        endbits = self._datastore.bytelength * 8 - (self._offset + self.len)
-        count += Bits._bitCount[self._datastore.getbyte(self._datastore.bytelength - 1) >> endbits]
+        # This is done a chunk at a time so that large files aren't read into memory all at once.
+        store = self._datastore
+        start = store.byteoffset
+        end = store.byteoffset + store.bytelength
+        end_bits = (store.offset + store.bitlength) % 8
+        count = 0
+        for chunk_start in range(start, end, COUNT_CHUNK_BYTES):
+            chunk_end = min(chunk_start + COUNT_CHUNK_BYTES, end)
+            chunk = store.getbyteslice(chunk_start, chunk_end)
+            # Clear any bits at the start and end that aren't part of the bitstring.
+            if chunk_start == start:
+                chunk[0] &= LOW_BITS_MASK[store.offset % 8]
+            if chunk_end == end and end_bits:
+                chunk[-1] &= HIGH_BITS_MASK[end_bits]
+            if sys.version_info >= (3, 10):
+                count += int.from_bytes(chunk, 'big').bit_count()
+            else:
+                count += sum(Bits._bitCount[b] for b in chunk)
         return count if value else self.len - count
 
     def pp(self, fmt: str = 'bin', width: int = 120, sep: Optional[str] = ' ',
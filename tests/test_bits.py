@@ -298,6 +298,12 @@ class Mmap(unittest.TestCase):
         self.assertEqual(a[:], bytearray([0x01, 0x23, 0x45, 0x67, 0x89, 0xab, 0xcd, 0xef]))
         self.assertEqual(a[2:4], bytearray([0x45, 0x67]))
 
+    def testFilePositionUnchanged(self):
+        self.f.seek(3)
+        a = MmapByteArray(self.f)
+        self.assertEqual(a.filelength, 8)
+        self.assertEqual(self.f.tell(), 3)
+
     def testWithLength(self):
         a = MmapByteArray(self.f, 3)
         self.assertEqual(a[0], 0x01)
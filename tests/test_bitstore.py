@@ -2,8 +2,11 @@
 
 import unittest
 import sys
+import os
 sys.path.insert(0, '..')
-from bitstring import ByteStore, equal, offsetcopy
+from bitstring import ByteStore, equal, offsetcopy, MmapByteArray, COMPARE_CHUNK_BYTES
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 class OffsetCopy(unittest.TestCase):
@@ -19,6 +22,21 @@ class OffsetCopy(unittest.TestCase):
         self.assertEqual(t.offset, 4)
         self.assertEqual(t.rawarray, bytearray([0, 16, 16, 16]))
 
+    def testOffsetDecrease(self):
+        s = ByteStore(bytearray([0x0f, 0xf0, 0xff]), 20, 4)
+        t = offsetcopy(s, 1)
+        self.assertEqual(t.bitlength, 20)
+        self.assertEqual(t.offset, 1)
+        self.assertTrue(equal(s, t))
+        self.assertEqual(t.rawarray[0] & 0x7f, 0x7f)
+
+    def testOffsetIncreaseFromLaterByte(self):
+        s = ByteStore(bytearray([0xff, 0x0f, 0xf0]), 12, 10)
+        t = offsetcopy(s, 4)
+        self.assertEqual(t.offset, 4)
+        self.assertEqual(t.rawarray, bytearray([0x03, 0xfc]))
+        self.assertTrue(equal(s, t))
+
 
 class Equals(unittest.TestCase):
 
@@ -35,3 +53,99 @@ class Equals(unittest.TestCase):
         t = ByteStore(bytearray([64]), 2, 1)
         self.assertTrue(equal(s, t))
         self.assertTrue(equal(t, s))
+
+    def testSameOffsetMiddleBytes(self):
+        s = ByteStore(bytearray([0, 0x0f, 1, 2, 3, 0xf0]), 32, 12)
+        t = ByteStore(bytearray([0x0f, 1, 2, 3, 0xf0]), 32, 4)
+        self.assertTrue(equal(s, t))
+        t.invertbit(20)
+        self.assertFalse(equal(s, t))
+
+    def testDifferentOffsetsManyBytes(self):
+        s = ByteStore(bytearray([0x01, 0x23, 0x45, 0x67, 0x89]), 36, 4)
+        t = ByteStore(bytearray([0x00, 0x04, 0x8d, 0x15, 0x9e, 0x24]), 36, 10)
+        self.assertTrue(equal(s, t))
+        self.assertTrue(equal(t, s))
+        t.invertbit(35)
+        self.assertFalse(equal(s, t))
+
+    def testWholeBytesOnByteBoundaries(self):
+        s = ByteStore(bytearray([1, 2, 3, 4]), 16, 8)
+        t = ByteStore(bytearray([2, 3]), 16, 0)
+        self.assertTrue(equal(s, t))
+        t.invertbit(15)
+        self.assertFalse(equal(s, t))
+
+    def testWholeBytesFromFile(self):
+        with open(os.path.join(THIS_DIR, 'test.m1v'), 'rb') as f:
+            m = MmapByteArray(f)
+            data = bytearray(m[:])
+            self.assertGreater(len(data), COMPARE_CHUNK_BYTES)
+            s = ByteStore(m, len(data) * 8, 0)
+            t = ByteStore(data, len(data) * 8, 0)
+            u = ByteStore(bytearray(8) + data, len(data) * 8, 64)
+            self.assertTrue(equal(s, t))
+            self.assertTrue(equal(t, s))
+            t.invertbit(len(data) * 8 - 1)
+            self.assertFalse(equal(s, t))
+            self.assertTrue(equal(u, s))
+            u.invertbit(COMPARE_CHUNK_BYTES * 8)
+            self.assertFalse(equal(u, s))
+            self.assertFalse(equal(u, t))
+
+    def testSameOffsetFromFile(self):
+        with open(os.path.join(THIS_DIR, 'test.m1v'), 'rb') as f:
+            m = MmapByteArray(f)
+            data = bytearray(m[:])
+            length = len(data) * 8 - 7
+            s = ByteStore(m, length, 3)
+            t = ByteStore(bytearray(2) + data, length, 19)
+            self.assertTrue(equal(s, t))
+            self.assertTrue(equal(t, s))
+            t.invertbit(COMPARE_CHUNK_BYTES * 8 + 1)
+            self.assertFalse(equal(s, t))
+            t.invertbit(COMPARE_CHUNK_BYTES * 8 + 1)
+            u = ByteStore(bytearray(data), length, 3)
+            self.assertTrue(equal(t, u))
+            u.invertbit(length // 2)
+            self.assertFalse(equal(t, u))
+            self.assertFalse(equal(u, s))
+
+    def testLongStores(self):
+        s = ByteStore(bytearray(range(40)), 300, 11)
+        for newoffset in range(8):
+            t = offsetcopy(s, newoffset)
+            self.assertTrue(equal(s, t))
+            t.invertbit(150)
+            self.assertFalse(equal(s, t))
+            t.invertbit(150)
+            t.invertbit(299)
+            self.assertFalse(equal(t, s))
+
+    def testMisalignedOverManyWindows(self):
+        window = COMPARE_CHUNK_BYTES * 8
+        s = ByteStore(bytearray(i % 251 for i in range(COMPARE_CHUNK_BYTES * 3)), window * 2 + 100, 3)
+        t = offsetcopy(s, 6)
+        self.assertTrue(equal(s, t))
+        for pos in (window - 1, window, window * 2 + 99):
+            t.invertbit(pos)
+            self.assertFalse(equal(s, t))
+            self.assertFalse(equal(t, s))
+            t.invertbit(pos)
+        self.assertTrue(equal(t, s))
+
+
+class InvertBits(unittest.TestCase):
+
+    def testWholeBytes(self):
+        s = ByteStore(bytearray([0x0f, 0xa5]), 16, 0)
+        s.invertbits()
+        self.assertEqual(s.rawarray, bytearray([0xf0, 0x5a]))
+
+    def testBitsOutsideStoreUnchanged(self):
+        s = ByteStore(bytearray([0x00, 0x0f, 0xa5, 0xff]), 13, 12)
+        s.invertbits()
+        self.assertEqual(s.rawarray, bytearray([0x00, 0x00, 0x5a, 0x7f]))
+        s = ByteStore(bytearray([0xcc]), 3, 2)
+        s.invertbits()
+        self.assertEqual(s.rawarray, bytearray([0xf4]))
@@ -955,6 +955,16 @@ class Append(unittest.TestCase):
         s.append('0b0')
         self.assertEqual(s.hex, '5050')
 
+    def testAppendWithBytesAfterEnd(self):
+        s = BitStream(bytes=b'\x0f\xff\x00\x00', offset=4, length=12)
+        s.append('0x5')
+        self.assertEqual(s.hex, 'fff5')
+        s = BitStream(bytes=b'\x0f\xff\x00\x00', offset=4, length=8)
+        s.append('0b1010')
+        self.assertEqual(s.hex, 'ffa')
+        s.append(BitStream(bytes=b'\x12\x34\x56', offset=4, length=16))
+        self.assertEqual(s.hex, 'ffa2345')
+
 
 class ByteAlign(unittest.TestCase):
     def testByteAlign(self):
@@ -1558,6 +1568,9 @@ class Adding(unittest.TestCase):
         s = BitStream()
         s.reverse()
         self.assertEqual(s.bin, '')
+        s = BitStream(bytes=b'\xab\xcd\xef', offset=9, length=7)
+        s.reverse()
+        self.assertEqual(s.bin, '1011001')
 
     def testInitWithConcatenatedStrings(self):
         s = BitStream('0xff 0Xee 0xd 0xcc')
@@ -3042,6 +3055,15 @@ class Invert(unittest.TestCase):
         a ^= '0b11111100000010'
         self.assertEqual(a, '0b00110000110001')
 
+    def testLogicalWithLargeOffsets(self):
+        a = BitStream(bytes=b'\x00\xff\x0f\xf0', offset=9, length=20)
+        b = BitStream(bytes=b'\x00\x00\xaa\xaa\xaa', offset=18, length=20)
+        self.assertEqual(a & b, '0b10101010000010101010')
+        self.assertEqual(a | b, '0b11111110101111111110')
+        self.assertEqual(~a, '0b00000001111000000001')
+        a ^= b
+        self.assertEqual(a, '0b01010100101101010100')
+
     def testLogicalInplaceErrors(self):
         a = BitStream(4)
         with self.assertRaises(ValueError):
@@ -3963,6 +3985,17 @@ class Count(unittest.TestCase):
         self.assertEqual(b.count(1), 16)
         self.assertEqual(b.count(0), 14)
 
+    def testCountWithLargeOffset(self):
+        a = ConstBitStream(bytes=b'\xff\x0f\xf0\x01', offset=10, length=17)
+        self.assertEqual(a.count(1), 8)
+        self.assertEqual(a.count(0), 9)
+
+    def testCountOverManyChunks(self):
+        data = b'\x0f' + b'\xa5' * (bitstring.COUNT_CHUNK_BYTES * 2) + b'\xf0'
+        a = ConstBitStream(bytes=data, offset=5, length=len(data) * 8 - 9)
+        self.assertEqual(a.count(1), 3 + bitstring.COUNT_CHUNK_BYTES * 8 + 4)
+        self.assertEqual(a.count(0), a.len - a.count(1))
+
 
 class ZeroBitReads(unittest.TestCase):
     def testInteger(self):
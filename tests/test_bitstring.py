@@ -22,11 +22,11 @@ class ModuleData(unittest.TestCase):
                     'InterpretError', 'ByteAlignError', 'CreationError', 'bytealigned', 'lsb0']
         self.assertEqual(set(bitstring.__all__), set(exported))
 
-    def testReverseDict(self):
-        d = bitstring.Bits._byteReversalDict
+    def testReverseTable(self):
+        d = bitstring.Bits._byteReversalTable
         for i in range(256):
             a = bitstring.Bits(uint=i, length=8)
-            b = d[i]
+            b = d[i:i + 1]
             self.assertEqual(a.bin[::-1], bitstring.Bits(bytes=b).bin)
 
 
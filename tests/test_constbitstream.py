@@ -19,6 +19,15 @@ class All(unittest.TestCase):
         height = s.read(12).uint
         self.assertEqual((width, height), (352, 288))
 
+    def testFromFileBackedBitstring(self):
+        s = bitstring.Bits(filename=os.path.join(THIS_DIR, 'test.m1v'))
+        t = CBS(s, offset=13, length=30)
+        self.assertEqual(t, s[13:43])
+        self.assertEqual(len(t._datastore.rawarray), 5)
+        t = CBS(s, offset=s.len - 11)
+        self.assertEqual(t, s[-11:])
+        self.assertEqual(CBS(s, offset=s.len - 11, length=0).len, 0)
+
 
 class InterleavedExpGolomb(unittest.TestCase):
     def testReading(self):